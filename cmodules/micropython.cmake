@@ -0,0 +1,2 @@
+# Top-level USER_C_MODULES entry point for CMake-based ports
+include(${CMAKE_CURRENT_LIST_DIR}/ssd1681_fast/micropython.cmake)
@@ -0,0 +1,12 @@
+# Build rules for CMake-based ports (e.g. rp2, esp32)
+add_library(usermod_ssd1681_fast INTERFACE)
+
+target_sources(usermod_ssd1681_fast INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}/ssd1681_fast.c
+)
+
+target_include_directories(usermod_ssd1681_fast INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}
+)
+
+target_link_libraries(usermod INTERFACE usermod_ssd1681_fast)
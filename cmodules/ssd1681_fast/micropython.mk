@@ -0,0 +1,5 @@
+# Build rules for make-based ports (e.g. esp8266, unix)
+SSD1681_FAST_MOD_DIR := $(USERMOD_DIR)
+
+SRC_USERMOD_C += $(SSD1681_FAST_MOD_DIR)/ssd1681_fast.c
+CFLAGS_USERMOD += -I$(SSD1681_FAST_MOD_DIR)
@@ -0,0 +1,159 @@
+// Optional C accelerator for the SSD1681 MicroPython driver
+//
+// Implements the buffer drawing primitives of ssd1681_driver.py in C. The
+// driver imports this module when it is built into the firmware and falls
+// back to its pure-Python paths otherwise. All functions operate on a single
+// 1-bit row-major buffer in user coordinates (bit 7 = leftmost pixel); the
+// driver applies the display orientation when the frame is shown.
+
+#include <string.h>
+
+#include "py/runtime.h"
+#include "py/obj.h"
+
+// Clip a rectangle [x0, x1) x [y0, y1) to the display and fill it one
+// scanline at a time; returns silently when the clipped area is empty
+static void fill_rect(uint8_t *buf, mp_int_t w, mp_int_t h,
+    mp_int_t x0, mp_int_t y0, mp_int_t x1, mp_int_t y1, bool value) {
+    if (x0 < 0) {
+        x0 = 0;
+    }
+    if (y0 < 0) {
+        y0 = 0;
+    }
+    if (x1 > w) {
+        x1 = w;
+    }
+    if (y1 > h) {
+        y1 = h;
+    }
+    if (x0 >= x1 || y0 >= y1) {
+        return;
+    }
+
+    mp_int_t row_bytes = w / 8;
+    mp_int_t first = x0 >> 3;
+    mp_int_t last = (x1 - 1) >> 3;
+    uint8_t first_mask = 0xFF >> (x0 & 7);
+    uint8_t last_mask = (uint8_t)(0xFF << (7 - ((x1 - 1) & 7)));
+    if (first == last) {
+        first_mask &= last_mask;
+    }
+
+    for (mp_int_t y = y0; y < y1; y++) {
+        uint8_t *row = buf + y * row_bytes;
+        if (value) {
+            row[first] |= first_mask;
+        } else {
+            row[first] &= ~first_mask;
+        }
+        if (first == last) {
+            continue;
+        }
+        if (last - first > 1) {
+            memset(row + first + 1, value ? 0xFF : 0x00, last - first - 1);
+        }
+        if (value) {
+            row[last] |= last_mask;
+        } else {
+            row[last] &= ~last_mask;
+        }
+    }
+}
+
+// Validate the common (buf, width, height) arguments
+static uint8_t *get_target(const mp_obj_t *args, mp_int_t *w, mp_int_t *h) {
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[0], &bufinfo, MP_BUFFER_WRITE);
+    *w = mp_obj_get_int(args[1]);
+    *h = mp_obj_get_int(args[2]);
+    if (*w <= 0 || *h <= 0 || (*w & 7) || (size_t)(*w * *h / 8) > bufinfo.len) {
+        mp_raise_ValueError(MP_ERROR_TEXT("buffer too small for display size"));
+    }
+    return bufinfo.buf;
+}
+
+// set_pixel(buf, width, height, x, y, value)
+static mp_obj_t ssd1681_fast_set_pixel(size_t n_args, const mp_obj_t *args) {
+    mp_int_t w, h;
+    uint8_t *buf = get_target(args, &w, &h);
+    mp_int_t x = mp_obj_get_int(args[3]);
+    mp_int_t y = mp_obj_get_int(args[4]);
+    if (x < 0 || x >= w || y < 0 || y >= h) {
+        return mp_const_none;
+    }
+    uint8_t mask = 0x80 >> (x & 7);
+    if (mp_obj_is_true(args[5])) {
+        buf[(y * w + x) >> 3] |= mask;
+    } else {
+        buf[(y * w + x) >> 3] &= ~mask;
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(ssd1681_fast_set_pixel_obj, 6, 6, ssd1681_fast_set_pixel);
+
+// fill_rect(buf, width, height, x0, y0, x1, y1, value)
+static mp_obj_t ssd1681_fast_fill_rect(size_t n_args, const mp_obj_t *args) {
+    mp_int_t w, h;
+    uint8_t *buf = get_target(args, &w, &h);
+    fill_rect(buf, w, h,
+        mp_obj_get_int(args[3]), mp_obj_get_int(args[4]),
+        mp_obj_get_int(args[5]), mp_obj_get_int(args[6]),
+        mp_obj_is_true(args[7]));
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(ssd1681_fast_fill_rect_obj, 8, 8, ssd1681_fast_fill_rect);
+
+// draw_glyph(buf, width, height, glyph_rows, x, y, scale, value)
+//
+// glyph_rows holds 8 scanline bytes; each horizontal run of set bits is
+// filled as one scale x (run * scale) block.
+static mp_obj_t ssd1681_fast_draw_glyph(size_t n_args, const mp_obj_t *args) {
+    mp_int_t w, h;
+    uint8_t *buf = get_target(args, &w, &h);
+    mp_buffer_info_t rowinfo;
+    mp_get_buffer_raise(args[3], &rowinfo, MP_BUFFER_READ);
+    if (rowinfo.len < 8) {
+        mp_raise_ValueError(MP_ERROR_TEXT("glyph needs 8 rows"));
+    }
+    const uint8_t *rows = rowinfo.buf;
+    mp_int_t x = mp_obj_get_int(args[4]);
+    mp_int_t y = mp_obj_get_int(args[5]);
+    mp_int_t scale = mp_obj_get_int(args[6]);
+    bool value = mp_obj_is_true(args[7]);
+
+    for (int row = 0; row < 8; row++) {
+        uint8_t row_bits = rows[row];
+        mp_int_t pixel_y = y + row * scale;
+        int col = 0;
+        while (col < 8) {
+            if (!(row_bits & (0x80 >> col))) {
+                col++;
+                continue;
+            }
+            int run_start = col;
+            while (col < 8 && (row_bits & (0x80 >> col))) {
+                col++;
+            }
+            fill_rect(buf, w, h,
+                x + run_start * scale, pixel_y, x + col * scale, pixel_y + scale, value);
+        }
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(ssd1681_fast_draw_glyph_obj, 8, 8, ssd1681_fast_draw_glyph);
+
+static const mp_rom_map_elem_t ssd1681_fast_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_ssd1681_fast) },
+    { MP_ROM_QSTR(MP_QSTR_set_pixel), MP_ROM_PTR(&ssd1681_fast_set_pixel_obj) },
+    { MP_ROM_QSTR(MP_QSTR_fill_rect), MP_ROM_PTR(&ssd1681_fast_fill_rect_obj) },
+    { MP_ROM_QSTR(MP_QSTR_draw_glyph), MP_ROM_PTR(&ssd1681_fast_draw_glyph_obj) },
+};
+static MP_DEFINE_CONST_DICT(ssd1681_fast_module_globals, ssd1681_fast_module_globals_table);
+
+const mp_obj_module_t ssd1681_fast_user_cmodule = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&ssd1681_fast_module_globals,
+};
+
+MP_REGISTER_MODULE(MP_QSTR_ssd1681_fast, ssd1681_fast_user_cmodule);
@@ -17,14 +17,10 @@ def draw_demo_content(display):
     display.text("TEMP: 25.3 C", 10, 100, color=COLOR_RED, font_size=2)
     
     # Draw a 20x20 black square below the TEMP line
-    for x in range(10, 30):
-        for y in range(130, 150):
-            display.pixel(x, y, COLOR_BLACK)
+    display.fill_rect(10, 130, 20, 20, COLOR_BLACK)
     
     # Draw a 20x20 red square to the right of the black square
-    for x in range(35, 55):
-        for y in range(130, 150):
-            display.pixel(x, y, COLOR_RED)
+    display.fill_rect(35, 130, 20, 20, COLOR_RED)
     
     # Draw a cross in the bottom right corner using black and red lines
     # Cross center at (175, 175), each arm 15 pixels long
@@ -32,12 +28,10 @@ def draw_demo_content(display):
     cross_size = 15
     
     # Draw black horizontal line
-    for x in range(cross_center_x - cross_size, cross_center_x + cross_size + 1):
-        display.pixel(x, cross_center_y, COLOR_BLACK)
+    display.hline(cross_center_x - cross_size, cross_center_y, 2 * cross_size + 1, COLOR_BLACK)
     
     # Draw red vertical line
-    for y in range(cross_center_y - cross_size, cross_center_y + cross_size + 1):
-        display.pixel(cross_center_x, y, COLOR_RED)
+    display.vline(cross_center_x, cross_center_y - cross_size, 2 * cross_size + 1, COLOR_RED)
     
     # Add some smaller text
     display.text("BYE WORLD!", 10, 180, color=COLOR_RED, font_size=1)
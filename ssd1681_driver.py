@@ -7,9 +7,16 @@
 # Other SSD1681-based displays should work with pin configuration adjustments
 
 from machine import Pin, SPI
+import micropython
 import time
 from b_torp_temp_display.ssd1681_driver_fonts import FONT_8X8
 
+# Optional C drawing primitives (see cmodules/); pure-Python paths are used without them
+try:
+    import ssd1681_fast as _fast
+except ImportError:
+    _fast = None
+
 # SSD1681 Command Constants
 CMD_SW_RESET = 0x12
 CMD_GATE_DRIVING_VOLTAGE = 0x01
@@ -33,6 +40,11 @@ UPDATE_MODE_FULL = 0xF7  # Full update with temperature measurement
 # Data entry modes
 DATA_ENTRY_MODE_DEFAULT = 0x03  # X increment, Y increment
 
+# BUSY polling intervals (ms)
+_BUSY_POLL_FAST_MS = 2     # Used for the first _BUSY_FAST_WINDOW_MS of a wait
+_BUSY_POLL_SLOW_MS = 10    # Used afterwards, e.g. during a full refresh
+_BUSY_FAST_WINDOW_MS = 100
+
 # Color constants
 COLOR_WHITE = 0
 COLOR_BLACK = 1
@@ -44,22 +56,248 @@ ORIENTATION_90 = 1   # Board text bottom-left (connector at left)
 ORIENTATION_180 = 2  # Board text top-left (connector at top)
 ORIENTATION_270 = 3  # Board text top-right (connector at right)
 
+def _bake_script(sequence):
+    """
+    Flatten a command sequence into a script for _send_script()
+    
+    Args:
+        sequence: Iterable of (command byte, parameter bytes or None)
+    
+    Returns:
+        (blob, runs): a memoryview over all command and parameter bytes, so
+        replay slices it without allocating, and a tuple of (end offset,
+        DC level) marking where DC changes in the blob
+    """
+    blob = bytearray()
+    runs = []
+    for cmd, params in sequence:
+        for level, chunk in ((0, bytes([cmd])), (1, params)):
+            if not chunk:
+                continue
+            blob.extend(chunk)
+            if runs and runs[-1][1] == level:
+                # Consecutive bytes at the same DC level go out in one write
+                runs[-1] = (len(blob), level)
+            else:
+                runs.append((len(blob), level))
+    return memoryview(bytes(blob)), tuple(runs)
+
+# Command sequences as (command byte, parameter bytes or None)
+# RAM write commands appended to a RAM window sequence; the framebuffer is the payload
+_WRITE_RAM_BW_SEQ = ((CMD_WRITE_RAM_BW, None),)
+_WRITE_RAM_RED_SEQ = ((CMD_WRITE_RAM_RED, None),)
+
+# Pre-baked scripts sent by _send_script() under a single CS assertion
+# Load the LUT from OTP and activate
+_LOAD_LUT_SCRIPT = _bake_script((
+    (CMD_LOAD_LUT, b'\xB1'),
+    (CMD_ACTIVATE_DISPLAY, None),
+))
+# Soft start, full update mode and master activation
+_SHOW_ACTIVATE_SCRIPT = _bake_script((
+    (CMD_SOFT_START, b'\xD7\xD6\x9D'),
+    (CMD_DISPLAY_UPDATE, bytes([UPDATE_MODE_FULL])),
+    (CMD_MASTER_ACTIVATE, None),
+))
+
+# Bit-reversed value of every byte, used to rotate the framebuffer by 180 degrees
+_BIT_REVERSE = bytes(sum(((i >> bit) & 1) << (7 - bit) for bit in range(8)) for i in range(256))
+
+# Per-bit set/clear masks indexed by bit_index (bit 0 = MSB = leftmost pixel)
+_SET_MASK = (0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01)
+_CLR_MASK = (0x7F, 0xBF, 0xDF, 0xEF, 0xF7, 0xFB, 0xFD, 0xFE)
+
+# (black/white buffer bit, red buffer bit) for each color
+# White: set bit in main buffer, clear red buffer
+# Black: clear bit in main buffer, clear red buffer
+# Red: set bit in main buffer (white background), set red buffer
+_COLOR_BITS = {
+    COLOR_WHITE: (True, False),
+    COLOR_BLACK: (False, False),
+    COLOR_RED: (True, True),
+}
+
+@micropython.viper
+def _fill_span(buf: ptr8, start: int, count: int, value: int):
+    """Set (value != 0) or clear `count` whole bytes of `buf` from `start`"""
+    fill = 0xFF if value else 0x00
+    i = start
+    end = start + count
+    while i < end:
+        buf[i] = fill
+        i += 1
+
+@micropython.viper
+def _clear_buffers(bw: ptr8, red: ptr8, size: int):
+    """Set `size` bytes of `bw` to white (0xFF) and of `red` to no red (0x00) in one pass"""
+    i = 0
+    while i < size:
+        bw[i] = 0xFF
+        red[i] = 0x00
+        i += 1
+
+@micropython.viper
+def _reverse_bits(dst: ptr8, src: ptr8, size: int):
+    """Copy `size` bytes in reverse order with each byte bit-reversed (180 degree rotation)"""
+    lut = ptr8(_BIT_REVERSE)
+    last = size - 1
+    for i in range(size):
+        dst[last - i] = lut[src[i]]
+
+@micropython.viper
+def _rotate_tiles(dst: ptr8, src: ptr8, row_bytes: int, mirror: int):
+    """
+    Rotate a square 1-bit buffer by 90 degrees, one 8x8 tile at a time
+    
+    Each tile is transposed with the 32-bit bit-twiddling method from
+    Hacker's Delight (transpose8). With mirror=0 the tile rows land in
+    reverse hardware row order (ORIENTATION_90); with mirror=1 the tile is
+    read bottom-up and lands in reverse byte column order (ORIENTATION_270).
+    Results are masked so the arithmetic is exact on signed 32-bit words.
+    """
+    n = row_bytes
+    width = n << 3
+    for by in range(n):
+        for bx in range(n):
+            # Load the tile's 8 rows into two words (rows 0-3 in x, rows 4-7 in y)
+            s = (by * n << 3) + bx
+            if mirror:
+                s += 7 * n
+                step = 0 - n
+            else:
+                step = n
+            x = (src[s] << 24) | (src[s + step] << 16) | (src[s + 2 * step] << 8) | src[s + 3 * step]
+            s += step << 2
+            y = (src[s] << 24) | (src[s + step] << 16) | (src[s + 2 * step] << 8) | src[s + 3 * step]
+            
+            # Swap 1x1, 2x2 and 4x4 sub-blocks across the diagonal
+            t = (x ^ (x >> 7)) & 0x00AA00AA
+            x = x ^ t ^ (t << 7)
+            t = (y ^ (y >> 7)) & 0x00AA00AA
+            y = y ^ t ^ (t << 7)
+            t = (x ^ (x >> 14)) & 0x0000CCCC
+            x = x ^ t ^ (t << 14)
+            t = (y ^ (y >> 14)) & 0x0000CCCC
+            y = y ^ t ^ (t << 14)
+            t = (x ^ (x & 0x0F0F0F0F)) | ((y >> 4) & 0x0F0F0F0F)
+            y = ((x & 0x0F0F0F0F) << 4) | (y & 0x0F0F0F0F)
+            x = t
+            
+            # Store the 8 transposed rows into their hardware rows
+            if mirror:
+                d = (bx * n << 3) + n - 1 - by
+                step = n
+            else:
+                d = (width - 1 - (bx << 3)) * n + by
+                step = 0 - n
+            dst[d] = (x >> 24) & 0xFF
+            dst[d + step] = (x >> 16) & 0xFF
+            dst[d + 2 * step] = (x >> 8) & 0xFF
+            dst[d + 3 * step] = x & 0xFF
+            d += step << 2
+            dst[d] = (y >> 24) & 0xFF
+            dst[d + step] = (y >> 16) & 0xFF
+            dst[d + 2 * step] = (y >> 8) & 0xFF
+            dst[d + 3 * step] = y & 0xFF
+
+def _orient_to_hw(dst_buf, src_buf, orientation, row_bytes):
+    """
+    Rewrite a buffer drawn in user coordinates into the controller's RAM layout
+    
+    Not called for ORIENTATION_180 (board text top-left, connector at top):
+    the layouts already match and show() sends the buffers as is.
+    
+    Args:
+        dst_buf: Hardware-layout buffer to fill
+        src_buf: Buffer in user (logical) coordinates
+        orientation: ORIENTATION_0, ORIENTATION_90, or ORIENTATION_270
+        row_bytes: Bytes per row (width // 8); 90/270 require a square display
+    """
+    if orientation == ORIENTATION_90:
+        # Board text bottom-left (connector at left)
+        _rotate_tiles(dst_buf, src_buf, row_bytes, 0)
+    elif orientation == ORIENTATION_270:
+        # Board text top-right (connector at right)
+        _rotate_tiles(dst_buf, src_buf, row_bytes, 1)
+    else:
+        # ORIENTATION_0 (and default): board text bottom-right (connector at bottom)
+        _reverse_bits(dst_buf, src_buf, len(src_buf))
+
+def _decode_glyph(columns):
+    """Convert column-major FONT_8X8 data into 8 scanline bytes (bit 7 = leftmost column)"""
+    rows = bytearray(8)
+    for col in range(8):
+        bits = columns[col]
+        for row in range(8):
+            if bits & (1 << row):
+                rows[row] |= 0x80 >> col
+    return bytes(rows)
+
+# Font transposed once at import so glyphs are walked in rendered scanline order
+_FONT_ROWS = {char: _decode_glyph(columns) for char, columns in FONT_8X8.items()}
+
 class SSD1681:
     
-    def __init__(self, spi, cs, dc, rst, busy, width=200, height=200, orientation=ORIENTATION_0):
+    def __init__(self, spi, cs, dc, rst, busy, width=200, height=200, orientation=ORIENTATION_0, partial_updates=False):
         self.spi = spi
         self.cs = cs
         self.dc = dc
         self.rst = rst
         self.busy = busy
+        # The viper buffer routines index raw pointers without bounds checks,
+        # so reject sizes they cannot walk safely
+        if width % 8:
+            raise ValueError("width must be a multiple of 8")
+        if orientation in (ORIENTATION_90, ORIENTATION_270) and width != height:
+            raise ValueError("ORIENTATION_90 and ORIENTATION_270 require a square display")
         self.width = width
         self.height = height
         self.orientation = orientation
+        # Upload only the rows changed since the last show() when few rows changed
+        self.partial_updates = partial_updates
         
-        # Initialize buffers
+        # Initialize buffers, drawn in user coordinates (row-major, bit 7 = leftmost pixel)
         self._buffer_size = width * height // 8
-        self.buffer = bytearray([0xFF] * self._buffer_size)  # White background
-        self.red_buffer = bytearray([0x00] * self._buffer_size)  # No red initially
+        self.buffer = bytearray(b'\xFF' * self._buffer_size)  # White background
+        self.red_buffer = bytearray(self._buffer_size)  # No red initially
+        self._row_bytes = width // 8
+        
+        # Orientation is applied once per show() by rewriting the buffers into
+        # hardware layout; ORIENTATION_180 already matches and sends them as is
+        if orientation == ORIENTATION_180:
+            self._hw_buffer = self.buffer
+            self._hw_red_buffer = self.red_buffer
+        else:
+            self._hw_buffer = bytearray(self._buffer_size)
+            self._hw_red_buffer = bytearray(self._buffer_size)
+        # Zero-copy windows for partial uploads; slicing a memoryview does not allocate a new buffer
+        self._hw_buffer_mv = memoryview(self._hw_buffer)
+        self._hw_red_buffer_mv = memoryview(self._hw_red_buffer)
+        
+        # Dirty region in user coordinates [x0, x1) x [y0, y1), and whether
+        # the controller RAM holds the last uploaded frame
+        self._reset_dirty()
+        self._ram_valid = False
+        
+        # Width and height never change, so the RAM configuration and the
+        # full-frame RAM writes are baked into byte scripts once
+        x_end = (width // 8) - 1
+        y_end = height - 1
+        self._configure_ram_script = _bake_script((
+            # Set gate driver output
+            (CMD_GATE_DRIVING_VOLTAGE, b'\xC7\x00\x00'),
+            # Set data entry mode
+            (CMD_DATA_ENTRY_MODE, bytes([DATA_ENTRY_MODE_DEFAULT])),
+            # X range: width in bytes; Y range: height in pixels
+            (CMD_SET_RAM_X_RANGE, bytes([0x00, x_end])),
+            (CMD_SET_RAM_Y_RANGE, bytes([0x00, 0x00, y_end & 0xFF, (y_end >> 8) & 0xFF])),
+            # Reset address counters
+            (CMD_SET_RAM_X_COUNTER, b'\x00'),
+            (CMD_SET_RAM_Y_COUNTER, b'\x00\x00'),
+        ))
+        full_window = self._ram_window_seq(0, height)
+        self._show_script_bw = _bake_script(full_window + _WRITE_RAM_BW_SEQ)
+        self._show_script_red = _bake_script(full_window + _WRITE_RAM_RED_SEQ)
         
         # Initialize pins
         self._init_pins()
@@ -73,87 +311,160 @@ class SSD1681:
     
     def _command(self, cmd, data=None):
         """Send command to display"""
+        cs = self.cs.value
         self.dc.value(0)  # Command mode
-        self.cs.value(0)
+        cs(0)
         self.spi.write(bytearray([cmd]))
-        self.cs.value(1)
-        time.sleep_ms(1)
+        cs(1)
         
         if data is not None:
             self._data(data)
     
     def _data(self, data):
-        """Send data to display"""
-        self.dc.value(1)  # Data mode
-        self.cs.value(0)
+        """Send data to display as a single SPI transfer"""
+        # Buffers are passed through untouched so the whole frame goes out in one write
         if isinstance(data, (list, tuple)):
-            self.spi.write(bytearray(data))
-        elif isinstance(data, (bytes, bytearray)):
-            self.spi.write(data)
-        else:
-            self.spi.write(bytearray([data]))
-        self.cs.value(1)
-        time.sleep_ms(1)
+            data = bytearray(data)
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytearray([data])
+        cs = self.cs.value
+        self.dc.value(1)  # Data mode
+        cs(0)
+        self.spi.write(data)
+        cs(1)
+    
+    def _send_script(self, script, payload=None):
+        """
+        Replay a pre-baked script while CS stays asserted
+        
+        Args:
+            script: (blob, runs) as built by _bake_script()
+            payload: Optional buffer sent as data after the script
+        """
+        # DC is switched only at the run boundaries, so a whole command
+        # sequence costs one CS pulse and one write per DC run
+        cs = self.cs.value
+        dc = self.dc.value
+        write = self.spi.write
+        blob, runs = script
+        start = 0
+        cs(0)
+        for end, level in runs:
+            dc(level)
+            write(blob[start:end])
+            start = end
+        if payload is not None:
+            dc(1)  # Data mode
+            write(payload)
+        cs(1)
     
     def _wait_busy(self, timeout_ms=15000):
         """Wait for display to be ready"""
+        # Short commands release BUSY within a few ms, so poll tightly at first
+        # and back off once it is clear a full refresh is in progress
         start = time.ticks_ms()
-        while self.busy.value() and (time.ticks_diff(time.ticks_ms(), start) < timeout_ms):
-            time.sleep_ms(50)
-        return time.ticks_diff(time.ticks_ms(), start) < timeout_ms
-    
-    def _reset_ram_address(self):
-        """Reset RAM address counters to origin"""
-        self._command(CMD_SET_RAM_X_COUNTER, [0x00])
-        self._command(CMD_SET_RAM_Y_COUNTER, [0x00, 0x00])
-    
-    def _map_coordinates(self, x, y):
-        """Map user coordinates to display memory layout for pixels"""
-        # Apply orientation transformation
-        if self.orientation == ORIENTATION_0:
-            # Board text bottom-right (connector at bottom) - our established working orientation
-            hw_x = self.width - 1 - x
-            hw_y = self.height - 1 - y
-        elif self.orientation == ORIENTATION_90:
-            # Board text bottom-left (connector at left)
-            hw_x = y
-            hw_y = self.width - 1 - x
-        elif self.orientation == ORIENTATION_180:
-            # Board text top-left (connector at top)
-            hw_x = x
-            hw_y = y
-        elif self.orientation == ORIENTATION_270:
-            # Board text top-right (connector at right)
-            hw_x = self.height - 1 - y
-            hw_y = x
-        else:
-            # Default to ORIENTATION_0
-            hw_x = self.width - 1 - x
-            hw_y = self.height - 1 - y
-        
-        # Standard row-major layout
-        byte_index = (hw_y * self.width + hw_x) // 8
-        bit_index = hw_x % 8
-        return byte_index, bit_index
+        while self.busy.value():
+            elapsed = time.ticks_diff(time.ticks_ms(), start)
+            if elapsed >= timeout_ms:
+                return False
+            time.sleep_ms(_BUSY_POLL_FAST_MS if elapsed < _BUSY_FAST_WINDOW_MS else _BUSY_POLL_SLOW_MS)
+        return True
+    
+    def _ram_window_seq(self, first_row, end_row):
+        """Build the sequence selecting hardware rows [first_row, end_row) and homing the counters"""
+        last_row = end_row - 1
+        return (
+            (CMD_SET_RAM_Y_RANGE, bytes([first_row & 0xFF, first_row >> 8, last_row & 0xFF, last_row >> 8])),
+            (CMD_SET_RAM_X_COUNTER, b'\x00'),
+            (CMD_SET_RAM_Y_COUNTER, bytes([first_row & 0xFF, first_row >> 8])),
+        )
+    
+    def _reset_dirty(self):
+        """Mark the buffers as matching the controller RAM"""
+        self._dirty_x0 = self.width
+        self._dirty_y0 = self.height
+        self._dirty_x1 = 0
+        self._dirty_y1 = 0
+    
+    def _mark_dirty(self, x0, y0, x1, y1):
+        """Grow the dirty region to include the user rectangle [x0, x1) x [y0, y1)"""
+        if x0 < self._dirty_x0:
+            self._dirty_x0 = x0
+        if y0 < self._dirty_y0:
+            self._dirty_y0 = y0
+        if x1 > self._dirty_x1:
+            self._dirty_x1 = x1
+        if y1 > self._dirty_y1:
+            self._dirty_y1 = y1
     
-    def _set_pixel_buffer(self, x, y, buffer, value):
+    def _dirty_hw_rows(self):
+        """Return the hardware rows [first, end) covered by the dirty region"""
+        if self._dirty_x0 >= self._dirty_x1 or self._dirty_y0 >= self._dirty_y1:
+            return 0, 0
+        orientation = self.orientation
+        if orientation == ORIENTATION_90:
+            return self.width - self._dirty_x1, self.width - self._dirty_x0
+        elif orientation == ORIENTATION_180:
+            return self._dirty_y0, self._dirty_y1
+        elif orientation == ORIENTATION_270:
+            return self._dirty_x0, self._dirty_x1
+        return self.height - self._dirty_y1, self.height - self._dirty_y0
+    
+    @micropython.native
+    def _fill_rect_buffer(self, x0, y0, x1, y1, buffer, value):
         """
-        Set a pixel in the specified buffer
+        Set or clear a rectangle [x0, x1) x [y0, y1) in a buffer
         
-        Args:
-            x: X coordinate
-            y: Y coordinate
-            buffer: Target buffer (self.buffer or self.red_buffer)
-            value: True to set bit, False to clear bit
+        Each scanline is written as a masked first byte, a run of whole bytes
+        and a masked last byte instead of one bit at a time.
         """
-        if not (0 <= x < self.width and 0 <= y < self.height):
+        row_bytes = self._row_bytes
+        first = x0 >> 3
+        last = (x1 - 1) >> 3
+        first_mask = 0xFF >> (x0 & 7)
+        last_mask = (0xFF << (7 - ((x1 - 1) & 7))) & 0xFF
+        if first == last:
+            first_mask &= last_mask
+        run = last - first - 1
+        
+        for y in range(y0, y1):
+            start = y * row_bytes + first
+            if value:
+                buffer[start] |= first_mask
+            else:
+                buffer[start] &= ~first_mask
+            if first == last:
+                continue
+            end = y * row_bytes + last
+            if run > 0:
+                _fill_span(buffer, start + 1, run, value)
+            if value:
+                buffer[end] |= last_mask
+            else:
+                buffer[end] &= ~last_mask
+    
+    def _fill_rect_buffers(self, x0, y0, x1, y1, color):
+        """Fill a user rectangle [x0, x1) x [y0, y1) in both buffers, clipped to the display"""
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, self.width)
+        y1 = min(y1, self.height)
+        if x0 >= x1 or y0 >= y1:
             return
-            
-        byte_index, bit_index = self._map_coordinates(x, y)
-        if value:
-            buffer[byte_index] |= (0x80 >> bit_index)
-        else:
-            buffer[byte_index] &= ~(0x80 >> bit_index)
+        
+        bits = _COLOR_BITS.get(color)
+        if bits is None:
+            return
+        
+        self._mark_dirty(x0, y0, x1, y1)
+        
+        if _fast is not None:
+            _fast.fill_rect(self.buffer, self.width, self.height, x0, y0, x1, y1, bits[0])
+            _fast.fill_rect(self.red_buffer, self.width, self.height, x0, y0, x1, y1, bits[1])
+            return
+        
+        self._fill_rect_buffer(x0, y0, x1, y1, self.buffer, bits[0])
+        self._fill_rect_buffer(x0, y0, x1, y1, self.red_buffer, bits[1])
     
     def reset(self):
         """Hardware reset sequence"""
@@ -173,33 +484,17 @@ class SSD1681:
     
     def _configure_ram(self):
         """Configure RAM settings and addressing"""
-        # Set gate driver output
-        self._command(CMD_GATE_DRIVING_VOLTAGE, [0xC7, 0x00, 0x00])
-        
-        # Set display RAM size and data entry mode (dynamic based on display size)
-        self._command(CMD_DATA_ENTRY_MODE, [DATA_ENTRY_MODE_DEFAULT])
-        
-        # Calculate RAM ranges based on actual display dimensions
-        # X range: width in bytes (width // 8)
-        x_end = (self.width // 8) - 1
-        self._command(CMD_SET_RAM_X_RANGE, [0x00, x_end])
-        
-        # Y range: height in pixels
-        y_end_low = (self.height - 1) & 0xFF
-        y_end_high = ((self.height - 1) >> 8) & 0xFF
-        self._command(CMD_SET_RAM_Y_RANGE, [0x00, 0x00, y_end_low, y_end_high])
-        
-        # Reset address counters
-        self._reset_ram_address()
+        self._send_script(self._configure_ram_script)
     
     def _load_lut(self):
         """Load Look-Up Table from OTP"""
-        self._command(CMD_LOAD_LUT, [0xB1])
-        self._command(CMD_ACTIVATE_DISPLAY)
+        self._send_script(_LOAD_LUT_SCRIPT)
         self._wait_busy()
     
     def init(self):
         """Initialize the display following official sequence"""
+        # RAM contents are unknown after reset, so the next show() uploads everything
+        self._ram_valid = False
         self._power_on_sequence()
         self._configure_ram()
         self._load_lut()
@@ -207,36 +502,96 @@ class SSD1681:
     
     def clear(self):
         """Clear the display buffer (set to all white)"""
-        # Set all bits to 1 since 1=white pixel in black/white buffer
-        for i in range(self._buffer_size):
-            self.buffer[i] = 0xFF
-        # Clear red buffer (0=no red)
-        for i in range(self._buffer_size):
-            self.red_buffer[i] = 0x00
+        # One fused pass: all bits to 1 in the black/white buffer (1=white pixel)
+        # and all bits to 0 in the red buffer (0=no red)
+        _clear_buffers(self.buffer, self.red_buffer, self._buffer_size)
+        self._mark_dirty(0, 0, self.width, self.height)
     
+    @micropython.native
     def pixel(self, x, y, color=COLOR_BLACK):
         """
         Set a pixel in the buffer
         
         Args:
-            x: X coordinate
-            y: Y coordinate  
+            x: X coordinate (int)
+            y: Y coordinate (int)
+            color: COLOR_WHITE, COLOR_BLACK, or COLOR_RED
+        
+        Coordinates must already be ints; use pixel_float() for float positions.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        bits = _COLOR_BITS.get(color)
+        if bits is None:
+            return
+        
+        # Dirty tracking and both buffer writes are inlined to avoid extra call frames
+        if x < self._dirty_x0:
+            self._dirty_x0 = x
+        if x >= self._dirty_x1:
+            self._dirty_x1 = x + 1
+        if y < self._dirty_y0:
+            self._dirty_y0 = y
+        if y >= self._dirty_y1:
+            self._dirty_y1 = y + 1
+        if _fast is not None:
+            _fast.set_pixel(self.buffer, self.width, self.height, x, y, bits[0])
+            _fast.set_pixel(self.red_buffer, self.width, self.height, x, y, bits[1])
+            return
+        
+        # Buffers are in user coordinates, so no orientation mapping is needed here
+        byte_index = (y * self.width + x) >> 3
+        bit_index = x & 7
+        buffer, red_buffer = self.buffer, self.red_buffer
+        if bits[0]:
+            buffer[byte_index] |= _SET_MASK[bit_index]
+        else:
+            buffer[byte_index] &= _CLR_MASK[bit_index]
+        if bits[1]:
+            red_buffer[byte_index] |= _SET_MASK[bit_index]
+        else:
+            red_buffer[byte_index] &= _CLR_MASK[bit_index]
+    
+    def pixel_float(self, x, y, color=COLOR_BLACK):
+        """Set a pixel in the buffer from non-integer coordinates"""
+        self.pixel(int(x), int(y), color)
+    
+    def fill_rect(self, x, y, w, h, color=COLOR_BLACK):
+        """
+        Draw a filled rectangle to the buffer
+        
+        Args:
+            x: X position (left edge)
+            y: Y position (top edge)
+            w: Width in pixels
+            h: Height in pixels
+            color: COLOR_WHITE, COLOR_BLACK, or COLOR_RED
+        """
+        self._fill_rect_buffers(x, y, x + w, y + h, color)
+    
+    def hline(self, x, y, w, color=COLOR_BLACK):
+        """
+        Draw a horizontal line to the buffer
+        
+        Args:
+            x: X position (left end)
+            y: Y position
+            w: Length in pixels
             color: COLOR_WHITE, COLOR_BLACK, or COLOR_RED
         """
-        x, y = int(x), int(y)
+        self._fill_rect_buffers(x, y, x + w, y + 1, color)
+    
+    def vline(self, x, y, h, color=COLOR_BLACK):
+        """
+        Draw a vertical line to the buffer
         
-        if color == COLOR_WHITE:
-            # White: set bit in main buffer, clear red buffer
-            self._set_pixel_buffer(x, y, self.buffer, True)
-            self._set_pixel_buffer(x, y, self.red_buffer, False)
-        elif color == COLOR_BLACK:
-            # Black: clear bit in main buffer, clear red buffer
-            self._set_pixel_buffer(x, y, self.buffer, False)
-            self._set_pixel_buffer(x, y, self.red_buffer, False)
-        elif color == COLOR_RED:
-            # Red: set bit in main buffer (white background), set red buffer
-            self._set_pixel_buffer(x, y, self.buffer, True)
-            self._set_pixel_buffer(x, y, self.red_buffer, True)
+        Args:
+            x: X position
+            y: Y position (top end)
+            h: Length in pixels
+            color: COLOR_WHITE, COLOR_BLACK, or COLOR_RED
+        """
+        self._fill_rect_buffers(x, y, x + 1, y + h, color)
     
     def text(self, string, x, y, color=COLOR_BLACK, font_size=1):
         """
@@ -244,12 +599,11 @@ class SSD1681:
         
         Args:
             string: Text to draw
-            x: X position (left edge)
-            y: Y position (top edge)
+            x: X position (left edge, int)
+            y: Y position (top edge, int)
             color: COLOR_WHITE, COLOR_BLACK, or COLOR_RED
             font_size: Scale factor for text (1=8x8, 2=16x16, etc.)
         """
-        x, y = int(x), int(y)
         char_width = 8 * font_size
         
         for char_index, char in enumerate(string):
@@ -258,36 +612,94 @@ class SSD1681:
                 break
             self._draw_char(char, char_x, y, color, font_size)
     
+    @micropython.native
     def _draw_char(self, char, x, y, color, font_size=1):
         """Draw a single character with optional scaling - uses standard orientation"""
-        char_data = FONT_8X8.get(char, FONT_8X8[' '])
+        rows = _FONT_ROWS.get(char, _FONT_ROWS[' '])
+        
+        if _fast is not None:
+            bits = _COLOR_BITS.get(color)
+            x0, y0 = max(x, 0), max(y, 0)
+            x1, y1 = min(x + 8 * font_size, self.width), min(y + 8 * font_size, self.height)
+            if bits is not None and x0 < x1 and y0 < y1:
+                self._mark_dirty(x0, y0, x1, y1)
+                _fast.draw_glyph(self.buffer, self.width, self.height, rows, x, y, font_size, bits[0])
+                _fast.draw_glyph(self.red_buffer, self.width, self.height, rows, x, y, font_size, bits[1])
+            return
         
-        # Always render in standard orientation - let pixel() handle coordinate mapping
+        if font_size == 1:
+            pixel = self.pixel
+            for row in range(8):
+                row_bits = rows[row]
+                if not row_bits:
+                    continue
+                for col in range(8):
+                    if row_bits & (0x80 >> col):
+                        pixel(x + col, y + row, color)
+            return
+        
+        # Scaled glyphs: each horizontal run of set bits becomes one filled block,
+        # written a byte at a time rather than pixel by pixel
+        fill_rect = self._fill_rect_buffers
         for row in range(8):
-            for col in range(8):
-                # Standard character rendering (same as ORIENTATION_0 was doing)
-                if char_data[7-col] & (1 << row):
-                    # Draw scaled pixel block
-                    for scale_row in range(font_size):
-                        for scale_col in range(font_size):
-                            pixel_x = x + (7 - col) * font_size + scale_col
-                            pixel_y = y + row * font_size + scale_row
-                            self.pixel(pixel_x, pixel_y, color)
-    
-    def show(self):
-        """Update the display with buffer contents"""
-        # Write black/white image data
-        self._reset_ram_address()
-        self._command(CMD_WRITE_RAM_BW, self.buffer)
+            row_bits = rows[row]
+            if not row_bits:
+                continue
+            pixel_y = y + row * font_size
+            col = 0
+            while col < 8:
+                if not row_bits & (0x80 >> col):
+                    col += 1
+                    continue
+                run_start = col
+                while col < 8 and row_bits & (0x80 >> col):
+                    col += 1
+                fill_rect(x + run_start * font_size, pixel_y,
+                          x + col * font_size, pixel_y + font_size, color)
+    
+    def show(self, full=False):
+        """
+        Update the display with buffer contents
         
-        # Write red image data
-        self._reset_ram_address()
-        self._command(CMD_WRITE_RAM_RED, self.red_buffer)
+        Args:
+            full: Upload the whole frame even when partial_updates is enabled
+        
+        With partial_updates enabled, only the hardware rows drawn to since the
+        last show() are written when they cover less than half the panel; the
+        controller RAM keeps the rest of the previous frame. The panel itself
+        still runs a full refresh.
+        """
+        row_bytes = self._row_bytes
+        first_row, end_row = 0, self.height
+        if self.partial_updates and self._ram_valid and not full:
+            first_row, end_row = self._dirty_hw_rows()
+            if (end_row - first_row) * 2 >= self.height:
+                first_row, end_row = 0, self.height
+        
+        # Apply the orientation to the whole frame in one pass
+        hw_buffer, hw_red_buffer = self._hw_buffer, self._hw_red_buffer
+        if first_row < end_row and hw_buffer is not self.buffer:
+            _orient_to_hw(hw_buffer, self.buffer, self.orientation, row_bytes)
+            _orient_to_hw(hw_red_buffer, self.red_buffer, self.orientation, row_bytes)
+        
+        if first_row == 0 and end_row == self.height:
+            # Write black/white image data: RAM window, write command and the
+            # whole buffer go out in one CS-asserted burst
+            self._send_script(self._show_script_bw, hw_buffer)
+            
+            # Write red image data
+            self._send_script(self._show_script_red, hw_red_buffer)
+        elif first_row < end_row:
+            # Only the dirty rows, sliced from the cached memoryviews
+            window = self._ram_window_seq(first_row, end_row)
+            start, end = first_row * row_bytes, end_row * row_bytes
+            self._send_script(_bake_script(window + _WRITE_RAM_BW_SEQ), self._hw_buffer_mv[start:end])
+            self._send_script(_bake_script(window + _WRITE_RAM_RED_SEQ), self._hw_red_buffer_mv[start:end])
+        self._ram_valid = True
+        self._reset_dirty()
         
         # Configure soft start and trigger display update
-        self._command(CMD_SOFT_START, [0xD7, 0xD6, 0x9D])
-        self._command(CMD_DISPLAY_UPDATE, [UPDATE_MODE_FULL])
-        self._command(CMD_MASTER_ACTIVATE)
+        self._send_script(_SHOW_ACTIVATE_SCRIPT)
         
         # Wait for update completion
         self._wait_busy()
@@ -297,7 +709,7 @@ class SSD1681:
         self._command(CMD_DEEP_SLEEP, [0x01])
 
 
-def create_display(cs_pin=17, dc_pin=16, rst_pin=20, busy_pin=21, sck_pin=18, mosi_pin=19, orientation=ORIENTATION_0, width=200, height=200):
+def create_display(cs_pin=17, dc_pin=16, rst_pin=20, busy_pin=21, sck_pin=18, mosi_pin=19, orientation=ORIENTATION_0, width=200, height=200, baudrate=10000000, partial_updates=False):
     """
     Create and return a configured SSD1681 display instance
     
@@ -308,9 +720,12 @@ def create_display(cs_pin=17, dc_pin=16, rst_pin=20, busy_pin=21, sck_pin=18, mo
         busy_pin: Busy status pin number (default: 21)
         sck_pin: SPI Clock pin number (default: 18)
         mosi_pin: SPI MOSI pin number (default: 19)
-        orientation: Display orientation (default: ORIENTATION_0)
-        width: Display width in pixels (default: 200)
+        orientation: Display orientation (default: ORIENTATION_0);
+                     ORIENTATION_90 and ORIENTATION_270 require width == height
+        width: Display width in pixels, a multiple of 8 (default: 200)
         height: Display height in pixels (default: 200)
+        baudrate: SPI clock frequency in Hz (default: 10000000)
+        partial_updates: Upload only changed rows in show() (default: False)
     
     Default wiring for Raspberry Pi Pico:
     VCC  → Pin 40 (VBUS - 5V) or Pin 36 (3V3)
@@ -322,7 +737,8 @@ def create_display(cs_pin=17, dc_pin=16, rst_pin=20, busy_pin=21, sck_pin=18, mo
     RST  → Pin 26 (GPIO 20)
     BUSY → Pin 27 (GPIO 21)
     """
-    spi = SPI(0, baudrate=1000000, polarity=0, phase=0, sck=Pin(sck_pin), mosi=Pin(mosi_pin))
+    # Hardware SPI0 in mode 0; the SSD1681 accepts SCK well above 10 MHz for writes
+    spi = SPI(0, baudrate=baudrate, polarity=0, phase=0, sck=Pin(sck_pin), mosi=Pin(mosi_pin))
     
     return SSD1681(
         spi=spi,
@@ -332,5 +748,6 @@ def create_display(cs_pin=17, dc_pin=16, rst_pin=20, busy_pin=21, sck_pin=18, mo
         busy=Pin(busy_pin),
         orientation=orientation,
         width=width,
-        height=height
+        height=height,
+        partial_updates=partial_updates
     )
\ No newline at end of file